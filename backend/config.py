@@ -10,6 +10,10 @@ class Settings(BaseSettings):
     # MongoDB
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_database: str = "mailerslave"
+    mongo_max_pool_size: int = 200
+    mongo_min_pool_size: int = 10
+    mongo_max_idle_ms: int = 300000
+    mongo_max_connecting: int = 4
     
     # SMTP
     smtp_host: str = "smtp.gmail.com"
@@ -18,11 +22,13 @@ class Settings(BaseSettings):
     smtp_password: str = ""
     smtp_use_tls: bool = True
     smtp_from_email: Optional[str] = None
+    smtp_concurrency: int = 20
     
     # Ollama
     ollama_model: str = "llama2"
     ollama_host: Optional[str] = None
     ollama_temperature: float = 0.7
+    ollama_concurrency: int = 4
     
     # Application
     app_name: str = "MailerSlave"
@@ -1,39 +1,56 @@
 """MongoDB database connection and utilities."""
 
+import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from backend.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Global database client and database objects
-client: AsyncIOMotorClient = None
-db: AsyncIOMotorDatabase = None
+# One client per event loop. Sharing a single client instance across loops
+# (e.g. multiple uvicorn/gunicorn workers) is an antipattern that causes
+# "attached to a different loop" errors, so each loop lazily gets its own.
+_clients: dict = {}
+
+
+def _get_client() -> AsyncIOMotorClient:
+    """Get (or lazily create) the client bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = AsyncIOMotorClient(
+            settings.mongodb_url,
+            maxPoolSize=settings.mongo_max_pool_size,
+            minPoolSize=settings.mongo_min_pool_size,
+            maxIdleTimeMS=settings.mongo_max_idle_ms,
+            maxConnecting=settings.mongo_max_connecting,
+        )
+        _clients[loop] = client
+    return client
 
 
 async def connect_to_mongo():
     """Connect to MongoDB."""
-    global client, db
     try:
         logger.info(f"Connecting to MongoDB at {settings.mongodb_url}")
-        client = AsyncIOMotorClient(settings.mongodb_url)
-        db = client[settings.mongodb_database]
-        
+        client = _get_client()
+
         # Verify connection
         await client.admin.command('ping')
         logger.info("Successfully connected to MongoDB")
-        
+
         # Create indexes
         await create_indexes()
-        
+
     except Exception as e:
         logger.error(f"Failed to connect to MongoDB: {e}")
         raise
 
 
 async def close_mongo_connection():
-    """Close MongoDB connection."""
-    global client
+    """Close the MongoDB client owned by the current event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
     if client:
         client.close()
         logger.info("Closed MongoDB connection")
@@ -41,32 +58,57 @@ async def close_mongo_connection():
 
 async def create_indexes():
     """Create database indexes for better performance."""
+    db = get_database()
     try:
         # Contacts indexes
         await db.contacts.create_index("email", unique=True)
         await db.contacts.create_index("created_at")
-        
+
         # Templates indexes
         await db.templates.create_index("name")
         await db.templates.create_index("created_at")
-        
+
         # Campaigns indexes
         await db.campaigns.create_index("name")
         await db.campaigns.create_index("status")
         await db.campaigns.create_index("created_at")
-        
+
         # Email logs indexes
-        await db.email_logs.create_index("campaign_id")
-        await db.email_logs.create_index("contact_id")
-        await db.email_logs.create_index("status")
         await db.email_logs.create_index("sent_at")
         await db.email_logs.create_index([("campaign_id", 1), ("contact_id", 1)])
-        
+        # Compound indexes: (status, sent_at) serves the "emails sent today"
+        # dashboard query; (campaign_id, status, created_at) backs both the
+        # campaign stats aggregation and list_email_logs' filtered,
+        # created_at-sorted listing; (contact_id, created_at) does the same
+        # for per-contact listings and (created_at,) alone covers the
+        # unfiltered recent-logs view. Index prefixes also cover the former
+        # single-field campaign_id/contact_id/status indexes.
+        await db.email_logs.create_index([("status", 1), ("sent_at", -1)])
+        await db.email_logs.create_index(
+            [("campaign_id", 1), ("status", 1), ("created_at", -1)]
+        )
+        await db.email_logs.create_index([("contact_id", 1), ("created_at", -1)])
+        await db.email_logs.create_index([("created_at", -1)])
+
         logger.info("Database indexes created successfully")
     except Exception as e:
         logger.warning(f"Error creating indexes: {e}")
 
 
 def get_database() -> AsyncIOMotorDatabase:
-    """Get database instance."""
-    return db
+    """Get the database instance for the current event loop."""
+    return _get_client()[settings.mongodb_database]
+
+
+def pool_status() -> dict:
+    """Report connection pool configuration and state for the current loop's client."""
+    client = _get_client()
+    pool_options = client.options.pool_options
+    return {
+        "max_pool_size": pool_options.max_pool_size,
+        "min_pool_size": pool_options.min_pool_size,
+        "max_idle_time_seconds": pool_options.max_idle_time_seconds,
+        "max_connecting": pool_options.max_connecting,
+        "nodes": [f"{host}:{port}" for host, port in client.nodes],
+        "clients": len(_clients),
+    }
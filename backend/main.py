@@ -3,10 +3,12 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import logging
 
-from backend.database import connect_to_mongo, close_mongo_connection
+from backend.database import connect_to_mongo, close_mongo_connection, pool_status
 from backend.routes import contacts, templates, campaigns, emails, dashboard
+from backend.services.email_sender import flush_email_logs
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +27,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down MailerSlave API...")
+    await flush_email_logs()
     await close_mongo_connection()
 
 
@@ -32,7 +35,8 @@ app = FastAPI(
     title="MailerSlave API",
     description="Email campaign management and automation API",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration
@@ -66,3 +70,9 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/debug/pool")
+async def debug_pool():
+    """Report MongoDB connection pool settings so tuning stays data-driven."""
+    return pool_status()
@@ -59,7 +59,6 @@ class ContactResponse(ContactBase):
     
     class Config:
         populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
 
 
 # Template models
@@ -96,7 +95,6 @@ class TemplateResponse(TemplateBase):
     
     class Config:
         populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
 
 
 # Campaign models
@@ -138,7 +136,6 @@ class CampaignResponse(CampaignBase):
     
     class Config:
         populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
 
 
 # Email log models
@@ -148,7 +145,10 @@ class EmailLogBase(BaseModel):
     contact_id: str
     template_id: str
     subject: str
-    body: str
+    # Rendered bodies can be many KB; logs keep a preview plus a hash
+    # for deduplication/verification instead of the full content
+    body_preview: str = ""
+    body_hash: str = ""
     status: EmailStatus = EmailStatus.PENDING
 
 
@@ -166,7 +166,6 @@ class EmailLogResponse(EmailLogBase):
     
     class Config:
         populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
 
 
 # Dashboard models
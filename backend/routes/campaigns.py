@@ -1,8 +1,10 @@
 """Campaigns API routes."""
 
+import asyncio
 from fastapi import APIRouter, HTTPException, status, BackgroundTasks
 from typing import List
 from bson import ObjectId
+from pymongo import ReturnDocument
 from datetime import datetime
 import logging
 
@@ -12,15 +14,23 @@ from backend.models import (
     CampaignResponse,
     CampaignStatus,
     CampaignSendRequest,
+    EmailStatus,
 )
+from backend.config import settings
 from backend.database import get_database
-from backend.services.email_sender import AsyncEmailSender, DryRunEmailSender
+from backend.utils import parse_object_id
+from backend.services.email_sender import AsyncEmailSender, DryRunEmailSender, body_log_fields
 from backend.services.ollama_service import OllamaService
 from backend.services.template_service import TemplateService
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# How many email log documents to buffer before flushing with insert_many,
+# and how long the flusher waits for new events before flushing anyway
+LOG_FLUSH_SIZE = 500
+LOG_FLUSH_INTERVAL = 0.5
+
 
 @router.post("/", response_model=CampaignResponse, status_code=status.HTTP_201_CREATED)
 async def create_campaign(campaign: CampaignCreate):
@@ -29,40 +39,52 @@ async def create_campaign(campaign: CampaignCreate):
     
     # Validate template exists
     try:
-        template = await db.templates.find_one({"_id": ObjectId(campaign.template_id)})
+        template = await db.templates.find_one(
+            {"_id": ObjectId(campaign.template_id)}, projection={"_id": 1}
+        )
     except Exception:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid template ID")
     
     if not template:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
     
-    # Validate contacts exist
-    contact_objects = []
-    for contact_id in campaign.contact_ids:
-        try:
-            contact = await db.contacts.find_one({"_id": ObjectId(contact_id)})
-            if not contact:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Contact {contact_id} not found"
-                )
-            contact_objects.append(contact)
-        except Exception:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid contact ID: {contact_id}")
+    # Validate contacts exist with a single $in query instead of one find per contact
+    try:
+        contact_oids = [ObjectId(contact_id) for contact_id in campaign.contact_ids]
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid contact ID in contact_ids")
+
+    if contact_oids:
+        found = await db.contacts.find(
+            {"_id": {"$in": contact_oids}}, projection={"_id": 1}
+        ).to_list(length=len(contact_oids))
+        missing = set(contact_oids) - {doc["_id"] for doc in found}
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Contacts not found: {', '.join(str(oid) for oid in missing)}"
+            )
     
     campaign_dict = campaign.model_dump()
+    # Store contact ids as native ObjectId: smaller BSON and no re-parsing at send time
+    campaign_dict["contact_ids"] = contact_oids
+    now = datetime.utcnow()
     campaign_dict["status"] = CampaignStatus.DRAFT.value
-    campaign_dict["created_at"] = datetime.utcnow()
-    campaign_dict["updated_at"] = datetime.utcnow()
+    campaign_dict["created_at"] = now
+    campaign_dict["updated_at"] = now
     campaign_dict["total_emails"] = len(campaign.contact_ids)
     campaign_dict["sent_count"] = 0
     campaign_dict["failed_count"] = 0
     
     result = await db.campaigns.insert_one(campaign_dict)
-    created_campaign = await db.campaigns.find_one({"_id": result.inserted_id})
-    created_campaign["_id"] = str(created_campaign["_id"])
-    
-    return CampaignResponse(**created_campaign)
+
+    # The inserted dict is already validated; no need to re-read and re-validate
+    campaign_dict.pop("_id", None)
+    campaign_dict["id"] = str(result.inserted_id)
+    campaign_dict["contact_ids"] = campaign.contact_ids
+    # model_construct skips coercion, so the enum field needs the real enum
+    campaign_dict["status"] = CampaignStatus.DRAFT
+    return CampaignResponse.model_construct(**campaign_dict)
 
 
 @router.get("/", response_model=List[CampaignResponse])
@@ -76,11 +98,15 @@ async def list_campaigns(skip: int = 0, limit: int = 100, status_filter: str = N
     
     cursor = db.campaigns.find(query).skip(skip).limit(limit).sort("created_at", -1)
     campaigns = await cursor.to_list(length=limit)
-    
+
     for campaign in campaigns:
-        campaign["_id"] = str(campaign["_id"])
-    
-    return [CampaignResponse(**campaign) for campaign in campaigns]
+        campaign["id"] = str(campaign.pop("_id"))
+        campaign["contact_ids"] = [str(c) for c in campaign.get("contact_ids", [])]
+        # model_construct skips coercion; hand it the enum, not the DB string
+        campaign["status"] = CampaignStatus(campaign["status"])
+
+    # Documents come from our own schema; skip re-validation on the read path
+    return [CampaignResponse.model_construct(**campaign) for campaign in campaigns]
 
 
 @router.get("/{campaign_id}", response_model=CampaignResponse)
@@ -88,15 +114,15 @@ async def get_campaign(campaign_id: str):
     """Get a specific campaign by ID."""
     db = get_database()
     
-    try:
-        campaign = await db.campaigns.find_one({"_id": ObjectId(campaign_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid campaign ID")
-    
+    campaign = await db.campaigns.find_one(
+        {"_id": parse_object_id(campaign_id, "Invalid campaign ID")}
+    )
+
     if not campaign:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
-    
+
     campaign["_id"] = str(campaign["_id"])
+    campaign["contact_ids"] = [str(c) for c in campaign.get("contact_ids", [])]
     return CampaignResponse(**campaign)
 
 
@@ -105,11 +131,11 @@ async def update_campaign(campaign_id: str, campaign_update: CampaignUpdate):
     """Update a campaign."""
     db = get_database()
     
-    try:
-        existing = await db.campaigns.find_one({"_id": ObjectId(campaign_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid campaign ID")
-    
+    campaign_oid = parse_object_id(campaign_id, "Invalid campaign ID")
+    existing = await db.campaigns.find_one(
+        {"_id": campaign_oid}, projection={"status": 1}
+    )
+
     if not existing:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
     
@@ -125,17 +151,24 @@ async def update_campaign(campaign_id: str, campaign_update: CampaignUpdate):
     # Update total_emails if contact_ids changed
     if "contact_ids" in update_data:
         update_data["total_emails"] = len(update_data["contact_ids"])
+        try:
+            update_data["contact_ids"] = [ObjectId(c) for c in update_data["contact_ids"]]
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid contact ID in contact_ids"
+            )
     
     update_data["updated_at"] = datetime.utcnow()
-    
-    await db.campaigns.update_one(
-        {"_id": ObjectId(campaign_id)},
-        {"$set": update_data}
+
+    # Update and fetch the fresh document in one round-trip
+    updated_campaign = await db.campaigns.find_one_and_update(
+        {"_id": campaign_oid},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER,
     )
-    
-    updated_campaign = await db.campaigns.find_one({"_id": ObjectId(campaign_id)})
     updated_campaign["_id"] = str(updated_campaign["_id"])
-    
+    updated_campaign["contact_ids"] = [str(c) for c in updated_campaign.get("contact_ids", [])]
+
     return CampaignResponse(**updated_campaign)
 
 
@@ -144,22 +177,22 @@ async def delete_campaign(campaign_id: str):
     """Delete a campaign."""
     db = get_database()
     
-    try:
-        campaign = await db.campaigns.find_one({"_id": ObjectId(campaign_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid campaign ID")
-    
+    campaign_oid = parse_object_id(campaign_id, "Invalid campaign ID")
+    campaign = await db.campaigns.find_one(
+        {"_id": campaign_oid}, projection={"status": 1}
+    )
+
     if not campaign:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
-    
+
     # Don't allow deletion of campaigns in progress
     if campaign["status"] == CampaignStatus.IN_PROGRESS.value:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete campaign that is in progress"
         )
-    
-    await db.campaigns.delete_one({"_id": ObjectId(campaign_id)})
+
+    await db.campaigns.delete_one({"_id": campaign_oid})
 
 
 @router.post("/{campaign_id}/send", response_model=dict)
@@ -171,14 +204,14 @@ async def send_campaign(
     """Start sending emails for a campaign."""
     db = get_database()
     
-    try:
-        campaign = await db.campaigns.find_one({"_id": ObjectId(campaign_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid campaign ID")
-    
+    campaign_oid = parse_object_id(campaign_id, "Invalid campaign ID")
+    campaign = await db.campaigns.find_one(
+        {"_id": campaign_oid}, projection={"status": 1}
+    )
+
     if not campaign:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
-    
+
     # Check campaign status
     if campaign["status"] not in [CampaignStatus.DRAFT.value, CampaignStatus.PAUSED.value]:
         raise HTTPException(
@@ -188,12 +221,14 @@ async def send_campaign(
     
     # Update campaign status
     await db.campaigns.update_one(
-        {"_id": ObjectId(campaign_id)},
+        {"_id": campaign_oid},
         {
             "$set": {
                 "status": CampaignStatus.IN_PROGRESS.value,
                 "started_at": datetime.utcnow(),
                 "updated_at": datetime.utcnow(),
+                "sent_count": 0,
+                "failed_count": 0,
             }
         }
     )
@@ -215,11 +250,22 @@ async def send_campaign(
 async def _send_campaign_emails(campaign_id: str, dry_run: bool = False):
     """Background task to send campaign emails."""
     db = get_database()
+    # Bind collection handles once; the send loop touches these thousands of times
+    campaigns = db.campaigns
+    contacts = db.contacts
+    templates = db.templates
+    email_logs = db.email_logs
     
     try:
         # Get campaign, template, and contacts
-        campaign = await db.campaigns.find_one({"_id": ObjectId(campaign_id)})
-        template = await db.templates.find_one({"_id": ObjectId(campaign["template_id"])})
+        campaign = await campaigns.find_one(
+            {"_id": ObjectId(campaign_id)},
+            projection={"contact_ids": 1, "template_id": 1},
+        )
+        template = await templates.find_one(
+            {"_id": ObjectId(campaign["template_id"])},
+            projection={"subject": 1, "content": 1, "use_llm": 1},
+        )
         
         # Initialize email sender
         if dry_run:
@@ -227,23 +273,70 @@ async def _send_campaign_emails(campaign_id: str, dry_run: bool = False):
         else:
             email_sender = AsyncEmailSender()
         
-        # Initialize Ollama if template uses LLM
+        # Initialize Ollama if template uses LLM; LLM calls get their own
+        # concurrency cap so SMTP fan-out doesn't flood the model server
         ollama_service = None
+        ollama_semaphore = None
         if template.get("use_llm", False):
             ollama_service = OllamaService()
+            ollama_semaphore = asyncio.Semaphore(settings.ollama_concurrency)
         
-        sent_count = 0
-        failed_count = 0
-        
-        # Send to each contact
-        for contact_id in campaign["contact_ids"]:
-            try:
-                contact = await db.contacts.find_one({"_id": ObjectId(contact_id)})
-                if not contact:
-                    logger.warning(f"Contact {contact_id} not found, skipping")
-                    failed_count += 1
+        # Bound how many sends are in flight at once
+        semaphore = asyncio.Semaphore(settings.smtp_concurrency)
+
+        # Parse subject and content templates once instead of once per contact;
+        # the precompiled format strings render via str.format_map in C
+        subject_template = TemplateService.compile_format_template(template["subject"])
+        content_template = TemplateService.compile_format_template(template["content"])
+
+        # Senders stream log/counter events through a queue; a single consumer
+        # batches them into insert_many + one $inc per flush
+        event_queue: asyncio.Queue = asyncio.Queue()
+
+        async def _consume_events():
+            """Drain the event queue, flushing every LOG_FLUSH_SIZE events or LOG_FLUSH_INTERVAL."""
+            log_batch: list = []
+            inc_totals = {"sent_count": 0, "failed_count": 0}
+
+            async def _flush():
+                if log_batch:
+                    batch = list(log_batch)
+                    log_batch.clear()
+                    try:
+                        await email_logs.insert_many(batch, ordered=False)
+                    except Exception as e:
+                        logger.error(f"Failed to flush email logs: {e}")
+                inc = {field: count for field, count in inc_totals.items() if count}
+                if inc:
+                    inc_totals.update({"sent_count": 0, "failed_count": 0})
+                    try:
+                        await campaigns.update_one(
+                            {"_id": ObjectId(campaign_id)}, {"$inc": inc}
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to update campaign counters: {e}")
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(event_queue.get(), timeout=LOG_FLUSH_INTERVAL)
+                except asyncio.TimeoutError:
+                    await _flush()
                     continue
-                
+                if event is None:  # sentinel: senders are done
+                    break
+                kind, payload = event
+                if kind == "log":
+                    log_batch.append(payload)
+                else:  # "inc"
+                    inc_totals[payload] += 1
+                if len(log_batch) >= LOG_FLUSH_SIZE:
+                    await _flush()
+            await _flush()
+
+        async def _send_to_contact(contact: dict) -> bool:
+            """Send one email under the concurrency limit. Returns True on success."""
+            contact_id = str(contact["_id"])
+            async with semaphore:
                 # Prepare recipient data
                 recipient_data = {
                     "email": contact["email"],
@@ -251,60 +344,105 @@ async def _send_campaign_emails(campaign_id: str, dry_run: bool = False):
                     "last_name": contact.get("last_name", ""),
                     **contact.get("custom_fields", {})
                 }
-                
+
                 # Generate or render email body
                 if ollama_service:
-                    body = await ollama_service.generate_email(
-                        template["content"],
-                        recipient_data
-                    )
+                    async with ollama_semaphore:
+                        body = await ollama_service.generate_email(
+                            template["content"],
+                            recipient_data
+                        )
                 else:
-                    body = TemplateService.render_template(
-                        template["content"],
-                        recipient_data
-                    )
-                
-                # Send email
+                    body = TemplateService.render_compiled(content_template, recipient_data)
+
+                subject = TemplateService.render_compiled(subject_template, recipient_data)
+
+                # Send email; logging is handled here in batches
                 success, error = await email_sender.send_email(
                     to_email=contact["email"],
-                    subject=template["subject"],
+                    subject=subject,
                     body=body,
-                    log_to_db=True,
-                    campaign_id=campaign_id,
-                    contact_id=contact_id,
-                    template_id=campaign["template_id"]
+                    log_to_db=False,
                 )
-                
-                if success:
-                    sent_count += 1
-                else:
-                    failed_count += 1
+
+                now = datetime.utcnow()
+                event_queue.put_nowait(("log", {
+                    "campaign_id": campaign_id,
+                    "contact_id": contact_id,
+                    "template_id": campaign["template_id"],
+                    "subject": subject,
+                    **body_log_fields(body),
+                    "status": EmailStatus.SENT.value if success else EmailStatus.FAILED.value,
+                    "sent_at": now if success else None,
+                    "error_message": error,
+                    "created_at": now,
+                }))
+                event_queue.put_nowait(("inc", "sent_count" if success else "failed_count"))
+
+                if not success:
                     logger.error(f"Failed to send to {contact['email']}: {error}")
-                
-            except Exception as e:
-                logger.error(f"Error sending to contact {contact_id}: {e}")
+                return success
+
+        # Stream contacts with a single batched cursor instead of one find_one per contact
+        contact_oids = [
+            contact_id if isinstance(contact_id, ObjectId) else ObjectId(contact_id)
+            for contact_id in campaign["contact_ids"]
+        ]
+        cursor = contacts.find(
+            {"_id": {"$in": contact_oids}},
+            projection={"email": 1, "first_name": 1, "last_name": 1, "custom_fields": 1},
+        ).batch_size(500)
+
+        consumer = asyncio.create_task(_consume_events())
+
+        tasks = [
+            asyncio.create_task(_send_to_contact(contact))
+            async for contact in cursor
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        sent_count = 0
+        failed_count = 0
+        for result in results:
+            if result is True:
+                sent_count += 1
+            else:
+                if isinstance(result, Exception):
+                    logger.error(f"Error sending campaign email: {result}")
+                    event_queue.put_nowait(("inc", "failed_count"))
                 failed_count += 1
-        
-        # Update campaign with final counts
-        await db.campaigns.update_one(
+
+        # Contacts that were deleted since campaign creation never came back from the cursor
+        missing_count = len(contact_oids) - len(results)
+        if missing_count:
+            logger.warning(f"{missing_count} contact(s) no longer exist, skipping")
+            for _ in range(missing_count):
+                event_queue.put_nowait(("inc", "failed_count"))
+            failed_count += missing_count
+
+        # Stop the consumer and wait for the final flush
+        event_queue.put_nowait(None)
+        await consumer
+        email_sender.close()
+
+        # Counters were incremented along the way; only finalize status here
+        await campaigns.update_one(
             {"_id": ObjectId(campaign_id)},
             {
                 "$set": {
                     "status": CampaignStatus.COMPLETED.value,
-                    "sent_count": sent_count,
-                    "failed_count": failed_count,
                     "completed_at": datetime.utcnow(),
                     "updated_at": datetime.utcnow(),
                 }
             }
         )
-        
+
         logger.info(f"Campaign {campaign_id} completed: {sent_count} sent, {failed_count} failed")
         
     except Exception as e:
         logger.error(f"Fatal error in campaign {campaign_id}: {e}")
         # Mark campaign as failed
-        await db.campaigns.update_one(
+        await campaigns.update_one(
             {"_id": ObjectId(campaign_id)},
             {
                 "$set": {
@@ -3,10 +3,13 @@
 from fastapi import APIRouter, HTTPException, status
 from typing import List
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
 from datetime import datetime
 
 from backend.models import ContactCreate, ContactUpdate, ContactResponse, BulkContactImport
 from backend.database import get_database
+from backend.utils import parse_object_id
 
 router = APIRouter()
 
@@ -17,22 +20,24 @@ async def create_contact(contact: ContactCreate):
     db = get_database()
     
     # Check if email already exists
-    existing = await db.contacts.find_one({"email": contact.email})
+    existing = await db.contacts.find_one({"email": contact.email}, projection={"_id": 1})
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Contact with email {contact.email} already exists"
         )
     
+    now = datetime.utcnow()
     contact_dict = contact.model_dump()
-    contact_dict["created_at"] = datetime.utcnow()
-    contact_dict["updated_at"] = datetime.utcnow()
+    contact_dict["created_at"] = now
+    contact_dict["updated_at"] = now
     
     result = await db.contacts.insert_one(contact_dict)
-    created_contact = await db.contacts.find_one({"_id": result.inserted_id})
-    created_contact["_id"] = str(created_contact["_id"])
-    
-    return ContactResponse(**created_contact)
+
+    # The inserted dict is already validated; no need to re-read and re-validate
+    contact_dict.pop("_id", None)
+    contact_dict["id"] = str(result.inserted_id)
+    return ContactResponse.model_construct(**contact_dict)
 
 
 @router.get("/", response_model=List[ContactResponse])
@@ -46,11 +51,12 @@ async def list_contacts(skip: int = 0, limit: int = 100, active: bool = None):
     
     cursor = db.contacts.find(query).skip(skip).limit(limit).sort("created_at", -1)
     contacts = await cursor.to_list(length=limit)
-    
+
     for contact in contacts:
-        contact["_id"] = str(contact["_id"])
-    
-    return [ContactResponse(**contact) for contact in contacts]
+        contact["id"] = str(contact.pop("_id"))
+
+    # Documents come from our own schema; skip re-validation on the read path
+    return [ContactResponse.model_construct(**contact) for contact in contacts]
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
@@ -58,11 +64,10 @@ async def get_contact(contact_id: str):
     """Get a specific contact by ID."""
     db = get_database()
     
-    try:
-        contact = await db.contacts.find_one({"_id": ObjectId(contact_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid contact ID")
-    
+    contact = await db.contacts.find_one(
+        {"_id": parse_object_id(contact_id, "Invalid contact ID")}
+    )
+
     if not contact:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
     
@@ -76,17 +81,19 @@ async def update_contact(contact_id: str, contact_update: ContactUpdate):
     db = get_database()
     
     # Get existing contact
-    try:
-        existing = await db.contacts.find_one({"_id": ObjectId(contact_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid contact ID")
-    
+    contact_oid = parse_object_id(contact_id, "Invalid contact ID")
+    existing = await db.contacts.find_one(
+        {"_id": contact_oid}, projection={"email": 1}
+    )
+
     if not existing:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
     
     # Check email uniqueness if email is being updated
     if contact_update.email and contact_update.email != existing["email"]:
-        email_exists = await db.contacts.find_one({"email": contact_update.email})
+        email_exists = await db.contacts.find_one(
+            {"email": contact_update.email}, projection={"_id": 1}
+        )
         if email_exists:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -96,15 +103,15 @@ async def update_contact(contact_id: str, contact_update: ContactUpdate):
     # Update fields
     update_data = contact_update.model_dump(exclude_unset=True)
     update_data["updated_at"] = datetime.utcnow()
-    
-    await db.contacts.update_one(
-        {"_id": ObjectId(contact_id)},
-        {"$set": update_data}
+
+    # Update and fetch the fresh document in one round-trip
+    updated_contact = await db.contacts.find_one_and_update(
+        {"_id": contact_oid},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER,
     )
-    
-    updated_contact = await db.contacts.find_one({"_id": ObjectId(contact_id)})
     updated_contact["_id"] = str(updated_contact["_id"])
-    
+
     return ContactResponse(**updated_contact)
 
 
@@ -113,11 +120,10 @@ async def delete_contact(contact_id: str):
     """Delete a contact."""
     db = get_database()
     
-    try:
-        result = await db.contacts.delete_one({"_id": ObjectId(contact_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid contact ID")
-    
+    result = await db.contacts.delete_one(
+        {"_id": parse_object_id(contact_id, "Invalid contact ID")}
+    )
+
     if result.deleted_count == 0:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
 
@@ -126,29 +132,38 @@ async def delete_contact(contact_id: str):
 async def bulk_import_contacts(bulk_import: BulkContactImport):
     """Bulk import contacts from CSV or JSON."""
     db = get_database()
-    
+
     created = 0
     skipped = 0
     errors = []
-    
+
+    # Let the unique index on email handle dedup instead of a find_one per row;
+    # one timestamp for the whole batch instead of two utcnow() calls per row
+    now = datetime.utcnow()
+    docs = []
     for contact_data in bulk_import.contacts:
+        contact_dict = contact_data.model_dump()
+        contact_dict["created_at"] = now
+        contact_dict["updated_at"] = now
+        docs.append(contact_dict)
+
+    if docs:
         try:
-            # Check if exists
-            existing = await db.contacts.find_one({"email": contact_data.email})
-            if existing:
-                skipped += 1
-                continue
-            
-            contact_dict = contact_data.model_dump()
-            contact_dict["created_at"] = datetime.utcnow()
-            contact_dict["updated_at"] = datetime.utcnow()
-            
-            await db.contacts.insert_one(contact_dict)
-            created += 1
-            
-        except Exception as e:
-            errors.append({"email": contact_data.email, "error": str(e)})
-    
+            result = await db.contacts.insert_many(docs, ordered=False)
+            created = len(result.inserted_ids)
+        except BulkWriteError as bwe:
+            details = bwe.details or {}
+            created = details.get("nInserted", 0)
+            for error in details.get("writeErrors", []):
+                if error.get("code") == 11000:  # duplicate key
+                    skipped += 1
+                else:
+                    failed_doc = error.get("op", {})
+                    errors.append({
+                        "email": failed_doc.get("email"),
+                        "error": error.get("errmsg", "unknown error"),
+                    })
+
     return {
         "created": created,
         "skipped": skipped,
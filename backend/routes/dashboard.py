@@ -1,50 +1,99 @@
 """Dashboard API routes."""
 
+import asyncio
+import time
 from fastapi import APIRouter
 from datetime import datetime, timedelta
 
-from backend.models import DashboardStats, CampaignResponse, EmailLogResponse, EmailStatus
+from backend.models import (
+    CampaignResponse,
+    CampaignStatus,
+    DashboardStats,
+    EmailLogResponse,
+    EmailStatus,
+)
 from backend.database import get_database
 
 router = APIRouter()
 
+# Collection totals change slowly; cache them briefly so dashboard refresh
+# storms hit memory instead of Mongo
+_TOTALS_TTL_SECONDS = 10
+_totals_cache: dict = {}
+
+
+async def _estimated_total(collection) -> int:
+    """Estimated document count for a collection, cached with a short TTL."""
+    cached = _totals_cache.get(collection.name)
+    if cached and time.monotonic() - cached[0] < _TOTALS_TTL_SECONDS:
+        return cached[1]
+    count = await collection.estimated_document_count()
+    _totals_cache[collection.name] = (time.monotonic(), count)
+    return count
+
+
+async def _email_log_counts(db, today_start: datetime) -> tuple[int, int]:
+    """Count total sent and sent-today emails in a single $facet pass."""
+    pipeline = [
+        {"$match": {"status": EmailStatus.SENT.value}},
+        {
+            "$facet": {
+                "total_sent": [{"$count": "n"}],
+                "sent_today": [
+                    {"$match": {"sent_at": {"$gte": today_start}}},
+                    {"$count": "n"},
+                ],
+            }
+        },
+    ]
+    results = await db.email_logs.aggregate(pipeline).to_list(length=1)
+    facets = results[0] if results else {}
+    total_sent = facets.get("total_sent") or [{"n": 0}]
+    sent_today = facets.get("sent_today") or [{"n": 0}]
+    return total_sent[0].get("n", 0), sent_today[0].get("n", 0)
+
 
 @router.get("/stats", response_model=DashboardStats)
 async def get_dashboard_stats():
     """Get dashboard statistics."""
     db = get_database()
-    
-    # Count totals
-    total_contacts = await db.contacts.count_documents({})
-    total_templates = await db.templates.count_documents({})
-    total_campaigns = await db.campaigns.count_documents({})
-    active_campaigns = await db.campaigns.count_documents({"status": "in_progress"})
-    total_emails_sent = await db.email_logs.count_documents({"status": EmailStatus.SENT.value})
-    
-    # Count emails sent today
+
     today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    emails_sent_today = await db.email_logs.count_documents({
-        "status": EmailStatus.SENT.value,
-        "sent_at": {"$gte": today_start}
-    })
-    
-    # Get recent campaigns (last 5)
-    recent_campaigns_cursor = db.campaigns.find().sort("created_at", -1).limit(5)
-    recent_campaigns_raw = await recent_campaigns_cursor.to_list(length=5)
-    
+
+    # All of these are independent; issue them concurrently instead of serially
+    (
+        total_contacts,
+        total_templates,
+        total_campaigns,
+        active_campaigns,
+        (total_emails_sent, emails_sent_today),
+        recent_campaigns_raw,
+        recent_emails_raw,
+    ) = await asyncio.gather(
+        _estimated_total(db.contacts),
+        _estimated_total(db.templates),
+        _estimated_total(db.campaigns),
+        db.campaigns.count_documents({"status": "in_progress"}),
+        _email_log_counts(db, today_start),
+        db.campaigns.find().sort("created_at", -1).limit(5).to_list(length=5),
+        db.email_logs.find().sort("created_at", -1).limit(10).to_list(length=10),
+    )
+
     recent_campaigns = []
+    # Documents come from our own schema; skip re-validation on the read
+    # path — but model_construct skips coercion too, so enum fields need
+    # the real enum members rather than the DB strings
     for campaign in recent_campaigns_raw:
-        campaign["_id"] = str(campaign["_id"])
-        recent_campaigns.append(CampaignResponse(**campaign))
-    
-    # Get recent emails (last 10)
-    recent_emails_cursor = db.email_logs.find().sort("created_at", -1).limit(10)
-    recent_emails_raw = await recent_emails_cursor.to_list(length=10)
-    
+        campaign["id"] = str(campaign.pop("_id"))
+        campaign["contact_ids"] = [str(c) for c in campaign.get("contact_ids", [])]
+        campaign["status"] = CampaignStatus(campaign["status"])
+        recent_campaigns.append(CampaignResponse.model_construct(**campaign))
+
     recent_emails = []
     for email in recent_emails_raw:
-        email["_id"] = str(email["_id"])
-        recent_emails.append(EmailLogResponse(**email))
+        email["id"] = str(email.pop("_id"))
+        email["status"] = EmailStatus(email["status"])
+        recent_emails.append(EmailLogResponse.model_construct(**email))
     
     return DashboardStats(
         total_contacts=total_contacts,
@@ -1,15 +1,29 @@
 """Email logs API routes."""
 
+import asyncio
+import time
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from bson import ObjectId
 from datetime import datetime, timedelta
 
 from backend.models import EmailLogResponse, EmailStatus
 from backend.database import get_database
+from backend.utils import parse_object_id
 
 router = APIRouter()
 
+# Fetch only the fields the response model serializes ("id" lives in "_id")
+_LOG_PROJECTION = {
+    ("_id" if field == "id" else field): 1 for field in EmailLogResponse.model_fields
+}
+
+# Dashboards poll campaign stats aggressively; a few seconds of staleness
+# is fine and spares the aggregation on every hit
+_STATS_TTL_SECONDS = 5
+_stats_cache: dict = {}
+
 
 @router.get("/", response_model=List[EmailLogResponse])
 async def list_email_logs(
@@ -46,13 +60,22 @@ async def list_email_logs(
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         query["created_at"] = {"$gte": cutoff_date}
     
-    cursor = db.email_logs.find(query).skip(skip).limit(limit).sort("created_at", -1)
-    logs = await cursor.to_list(length=limit)
-    
-    for log in logs:
+    cursor = (
+        db.email_logs.find(query, projection=_LOG_PROJECTION)
+        .skip(skip)
+        .limit(limit)
+        .sort("created_at", -1)
+    )
+
+    # Serialize documents straight from the cursor with orjson instead of
+    # round-tripping each one through a Pydantic model and stdlib json;
+    # the field stays "_id" on the wire, matching the model's alias
+    logs = []
+    async for log in cursor:
         log["_id"] = str(log["_id"])
-    
-    return [EmailLogResponse(**log) for log in logs]
+        logs.append(log)
+
+    return ORJSONResponse(logs)
 
 
 @router.get("/{log_id}", response_model=EmailLogResponse)
@@ -60,16 +83,17 @@ async def get_email_log(log_id: str):
     """Get a specific email log by ID."""
     db = get_database()
     
-    try:
-        log = await db.email_logs.find_one({"_id": ObjectId(log_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid log ID")
-    
+    log = await db.email_logs.find_one(
+        {"_id": parse_object_id(log_id, "Invalid log ID")}
+    )
+
     if not log:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Email log not found")
     
-    log["_id"] = str(log["_id"])
-    return EmailLogResponse(**log)
+    log["id"] = str(log.pop("_id"))
+    # model_construct skips coercion; hand it the enum, not the DB string
+    log["status"] = EmailStatus(log["status"])
+    return EmailLogResponse.model_construct(**log)
 
 
 @router.get("/campaign/{campaign_id}/stats", response_model=dict)
@@ -77,22 +101,45 @@ async def get_campaign_stats(campaign_id: str):
     """Get statistics for a specific campaign."""
     db = get_database()
     
-    # Validate campaign exists
-    try:
-        campaign = await db.campaigns.find_one({"_id": ObjectId(campaign_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid campaign ID")
-    
+    campaign_oid = parse_object_id(campaign_id, "Invalid campaign ID")
+
+    cached = _stats_cache.get(campaign_id)
+    if cached is not None and time.monotonic() - cached[0] < _STATS_TTL_SECONDS:
+        return cached[1]
+
+    # Count emails by status in a single aggregation pass
+    def _status_sum(status_value: str) -> dict:
+        return {"$sum": {"$cond": [{"$eq": ["$status", status_value]}, 1, 0]}}
+
+    pipeline = [
+        {"$match": {"campaign_id": campaign_id}},
+        {
+            "$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "sent": _status_sum(EmailStatus.SENT.value),
+                "failed": _status_sum(EmailStatus.FAILED.value),
+                "pending": _status_sum(EmailStatus.PENDING.value),
+            }
+        },
+    ]
+
+    # The existence check and the aggregation are independent; run them concurrently
+    campaign, results = await asyncio.gather(
+        db.campaigns.find_one({"_id": campaign_oid}, projection={"_id": 1}),
+        db.email_logs.aggregate(pipeline).to_list(length=1),
+    )
+
     if not campaign:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
-    
-    # Count emails by status
-    total = await db.email_logs.count_documents({"campaign_id": campaign_id})
-    sent = await db.email_logs.count_documents({"campaign_id": campaign_id, "status": EmailStatus.SENT.value})
-    failed = await db.email_logs.count_documents({"campaign_id": campaign_id, "status": EmailStatus.FAILED.value})
-    pending = await db.email_logs.count_documents({"campaign_id": campaign_id, "status": EmailStatus.PENDING.value})
-    
-    return {
+
+    counts = results[0] if results else {}
+    total = counts.get("total", 0)
+    sent = counts.get("sent", 0)
+    failed = counts.get("failed", 0)
+    pending = counts.get("pending", 0)
+
+    stats = {
         "campaign_id": campaign_id,
         "total": total,
         "sent": sent,
@@ -100,3 +147,5 @@ async def get_campaign_stats(campaign_id: str):
         "pending": pending,
         "success_rate": (sent / total * 100) if total > 0 else 0
     }
+    _stats_cache[campaign_id] = (time.monotonic(), stats)
+    return stats
@@ -7,6 +7,7 @@ from datetime import datetime
 
 from backend.models import TemplateCreate, TemplateUpdate, TemplateResponse
 from backend.database import get_database
+from backend.utils import parse_object_id
 from backend.services.template_service import TemplateService
 from backend.services.ollama_service import OllamaService
 
@@ -21,12 +22,12 @@ async def create_template(template: TemplateCreate):
     # If LLM is enabled, verify Ollama is available
     if template.use_llm:
         ollama_service = OllamaService()
-        if not ollama_service.test_connection():
+        if not await ollama_service.test_connection():
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE, 
                 detail="Ollama service is not available. Please ensure Ollama is running."
             )
-        if not ollama_service.check_model_available():
+        if not await ollama_service.check_model_available():
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE, 
                 detail=f"Ollama model '{ollama_service.model}' is not available. Please pull the model first."
@@ -35,16 +36,18 @@ async def create_template(template: TemplateCreate):
     # Extract placeholders from template content
     placeholders = TemplateService.extract_placeholders(template.content)
     
+    now = datetime.utcnow()
     template_dict = template.model_dump()
     template_dict["placeholders"] = placeholders
-    template_dict["created_at"] = datetime.utcnow()
-    template_dict["updated_at"] = datetime.utcnow()
+    template_dict["created_at"] = now
+    template_dict["updated_at"] = now
     
     result = await db.templates.insert_one(template_dict)
-    created_template = await db.templates.find_one({"_id": result.inserted_id})
-    created_template["_id"] = str(created_template["_id"])
-    
-    return TemplateResponse(**created_template)
+
+    # The inserted dict is already validated; no need to re-read and re-validate
+    template_dict.pop("_id", None)
+    template_dict["id"] = str(result.inserted_id)
+    return TemplateResponse.model_construct(**template_dict)
 
 
 @router.get("/", response_model=List[TemplateResponse])
@@ -54,11 +57,12 @@ async def list_templates(skip: int = 0, limit: int = 100):
     
     cursor = db.templates.find().skip(skip).limit(limit).sort("created_at", -1)
     templates = await cursor.to_list(length=limit)
-    
+
+    # Documents already match our schema; skip re-validation on the list path
     for template in templates:
-        template["_id"] = str(template["_id"])
-    
-    return [TemplateResponse(**template) for template in templates]
+        template["id"] = str(template.pop("_id"))
+
+    return [TemplateResponse.model_construct(**template) for template in templates]
 
 
 @router.get("/{template_id}", response_model=TemplateResponse)
@@ -66,16 +70,15 @@ async def get_template(template_id: str):
     """Get a specific template by ID."""
     db = get_database()
     
-    try:
-        template = await db.templates.find_one({"_id": ObjectId(template_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid template ID")
-    
+    template = await db.templates.find_one(
+        {"_id": parse_object_id(template_id, "Invalid template ID")}
+    )
+
     if not template:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
     
-    template["_id"] = str(template["_id"])
-    return TemplateResponse(**template)
+    template["id"] = str(template.pop("_id"))
+    return TemplateResponse.model_construct(**template)
 
 
 @router.put("/{template_id}", response_model=TemplateResponse)
@@ -83,11 +86,11 @@ async def update_template(template_id: str, template_update: TemplateUpdate):
     """Update a template."""
     db = get_database()
     
-    try:
-        existing = await db.templates.find_one({"_id": ObjectId(template_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid template ID")
-    
+    template_oid = parse_object_id(template_id, "Invalid template ID")
+    existing = await db.templates.find_one(
+        {"_id": template_oid}, projection={"_id": 1}
+    )
+
     if not existing:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
     
@@ -100,14 +103,14 @@ async def update_template(template_id: str, template_update: TemplateUpdate):
     update_data["updated_at"] = datetime.utcnow()
     
     await db.templates.update_one(
-        {"_id": ObjectId(template_id)},
+        {"_id": template_oid},
         {"$set": update_data}
     )
-    
-    updated_template = await db.templates.find_one({"_id": ObjectId(template_id)})
-    updated_template["_id"] = str(updated_template["_id"])
-    
-    return TemplateResponse(**updated_template)
+
+    updated_template = await db.templates.find_one({"_id": template_oid})
+    updated_template["id"] = str(updated_template.pop("_id"))
+
+    return TemplateResponse.model_construct(**updated_template)
 
 
 @router.delete("/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -115,10 +118,9 @@ async def delete_template(template_id: str):
     """Delete a template."""
     db = get_database()
     
-    try:
-        result = await db.templates.delete_one({"_id": ObjectId(template_id)})
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid template ID")
-    
+    result = await db.templates.delete_one(
+        {"_id": parse_object_id(template_id, "Invalid template ID")}
+    )
+
     if result.deleted_count == 0:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
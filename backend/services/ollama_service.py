@@ -1,13 +1,19 @@
 """Ollama LLM service for generating personalized email content."""
 
+import asyncio
+import time
 import ollama
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import logging
 
 from backend.config import settings
 
 logger = logging.getLogger(__name__)
 
+# How long a model listing from Ollama stays fresh; installed models
+# rarely change mid-run, so avoid an HTTP round trip per check
+_MODEL_LIST_TTL_SECONDS = 60.0
+
 
 class OllamaService:
     """Generates personalized email content using Ollama LLM API."""
@@ -22,7 +28,22 @@ class OllamaService:
         self.model = model or settings.ollama_model
         self.temperature = temperature if temperature is not None else settings.ollama_temperature
         self.host = host or settings.ollama_host
-        self.client = ollama.Client(host=self.host) if self.host else ollama.Client()
+        # AsyncClient awaits real network I/O, so LLM generation overlaps
+        # with SMTP sends instead of blocking the event loop per request
+        self.client = ollama.AsyncClient(host=self.host) if self.host else ollama.AsyncClient()
+        self._models_cache: Optional[dict] = None
+        self._models_cache_ts = 0.0
+
+    async def _list_models(self) -> dict:
+        """Return the Ollama model listing, cached for a short TTL."""
+        now = time.monotonic()
+        if (
+            self._models_cache is None
+            or now - self._models_cache_ts >= _MODEL_LIST_TTL_SECONDS
+        ):
+            self._models_cache = await self.client.list()
+            self._models_cache_ts = now
+        return self._models_cache
 
     async def generate_email(
         self,
@@ -61,7 +82,7 @@ Please generate a personalized email based on the template above, incorporating
         try:
             logger.info(f"Generating email for recipient: {recipient_data.get('email', 'unknown')}")
 
-            response = self.client.chat(
+            response = await self.client.chat(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -79,24 +100,52 @@ Please generate a personalized email based on the template above, incorporating
             logger.error(f"Error generating email with Ollama: {e}")
             raise RuntimeError(f"Failed to generate email: {e}")
 
+    async def generate_email_batch(
+        self,
+        template: str,
+        recipients: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Generate personalized emails for many recipients concurrently.
+
+        Args:
+            template: Base email template
+            recipients: List of recipient data dictionaries
+            system_prompt: Optional system prompt to guide the LLM
+            concurrency: Max in-flight requests; size this to the Ollama
+                server's --parallel setting (defaults to settings.ollama_concurrency)
+
+        Returns:
+            Generated email contents, in recipient order
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.ollama_concurrency)
+
+        async def _generate_one(recipient_data: Dict[str, str]) -> str:
+            async with semaphore:
+                return await self.generate_email(template, recipient_data, system_prompt)
+
+        return await asyncio.gather(*(_generate_one(r) for r in recipients))
+
     def _format_recipient_data(self, data: Dict[str, str]) -> str:
         """Format recipient data for the prompt."""
         return "\n".join([f"- {key}: {value}" for key, value in data.items()])
 
-    def test_connection(self) -> bool:
+    async def test_connection(self) -> bool:
         """Test the connection to Ollama API."""
         try:
-            models = self.client.list()
+            models = await self._list_models()
             logger.info(f"Ollama connection test successful. Available models: {len(models.get('models', []))}")
             return True
         except Exception as e:
             logger.error(f"Ollama connection test failed: {e}")
             return False
 
-    def check_model_available(self) -> bool:
+    async def check_model_available(self) -> bool:
         """Check if the configured model is available."""
         try:
-            models = self.client.list()
+            models = await self._list_models()
             model_names = [m["name"] for m in models.get("models", [])]
             available = self.model in model_names
             if not available:
@@ -0,0 +1,26 @@
+"""Shared helpers for API routes."""
+
+from bson import ObjectId
+from fastapi import HTTPException, status
+
+
+def parse_object_id(value: str, detail: str = "Invalid ID") -> ObjectId:
+    """
+    Convert a path parameter to an ObjectId, rejecting malformed input.
+
+    ObjectId.is_valid is checked first so bad IDs are refused with a cheap
+    comparison instead of raising and unwinding an exception.
+
+    Args:
+        value: The raw ID string from the request
+        detail: Error detail used in the 400 response
+
+    Returns:
+        The parsed ObjectId
+
+    Raises:
+        HTTPException: 400 if the value is not a valid ObjectId
+    """
+    if not ObjectId.is_valid(value):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+    return ObjectId(value)
@@ -1,6 +1,8 @@
 """CLI interface for MailerSlave."""
 
 import argparse
+import asyncio
+import itertools
 import logging
 import sys
 from pathlib import Path
@@ -136,7 +138,7 @@ def validate_inputs(csv_path: str, template_path: str) -> bool:
     return True
 
 
-def send_emails(
+async def send_emails(
     csv_reader: CSVReader,
     template_handler: TemplateHandler,
     email_sender: EmailSender,
@@ -144,9 +146,13 @@ def send_emails(
     subject: str,
     limit: Optional[int] = None,
     use_llm: bool = True,
+    concurrency: int = 8,
 ) -> tuple[int, int]:
     """
-    Send emails to all recipients.
+    Send emails to all recipients concurrently.
+
+    Recipients are processed by up to `concurrency` tasks at once so LLM
+    generation and SMTP round trips overlap instead of running back to back.
 
     Args:
         csv_reader: CSV reader instance
@@ -156,46 +162,61 @@ def send_emails(
         subject: Email subject
         limit: Maximum number of emails to send
         use_llm: Whether to use LLM for generation
+        concurrency: Maximum number of recipients processed in parallel
 
     Returns:
         Tuple of (successful_count, failed_count)
     """
-    recipients = csv_reader.read_emails()
-    total = len(recipients)
-
+    # Stream rows straight off the parser instead of materializing the file
+    recipients = csv_reader.iter_emails()
     if limit:
-        recipients = recipients[:limit]
-        logger.info(f"Limiting to {limit} emails out of {total} total")
+        logger.info(f"Limiting to {limit} emails")
+        recipients = itertools.islice(recipients, limit)
 
-    logger.info(f"Sending emails to {len(recipients)} recipient(s)")
-
-    successful = 0
-    failed = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    placeholders = template_handler.extract_placeholders()
 
-    for i, recipient_data in enumerate(recipients, 1):
+    async def _process_recipient(index: int, recipient_data: dict) -> bool:
         email_address = recipient_data.get("email")
-        logger.info(f"[{i}/{len(recipients)}] Processing: {email_address}")
-
-        try:
-            # Generate or render email content
-            if use_llm and ollama_generator:
+        async with semaphore:
+            logger.info(f"[{index}] Processing: {email_address}")
+
+            # Generate or render email content; ollama and smtplib are both
+            # synchronous, so their calls run in worker threads. When the
+            # recipient data covers every placeholder, plain substitution
+            # already yields the final email — skip the LLM round-trip.
+            if use_llm and ollama_generator and not placeholders <= recipient_data.keys():
                 template = template_handler.get_template()
-                email_body = ollama_generator.generate_email(template, recipient_data)
+                email_body = await asyncio.to_thread(
+                    ollama_generator.generate_email, template, recipient_data
+                )
             else:
                 email_body = template_handler.render_template(recipient_data)
 
-            # Send email
-            success = email_sender.send_email(
-                to_email=email_address, subject=subject, body=email_body
+            return await asyncio.to_thread(
+                email_sender.send_email,
+                to_email=email_address,
+                subject=subject,
+                body=email_body,
             )
 
-            if success:
-                successful += 1
-            else:
-                failed += 1
+    tasks = []
+    addresses = []
+    for i, recipient_data in enumerate(recipients, 1):
+        addresses.append(recipient_data.get("email"))
+        tasks.append(_process_recipient(i, recipient_data))
 
-        except Exception as e:
-            logger.error(f"Error processing {email_address}: {e}")
+    logger.info(f"Sending emails to {len(tasks)} recipient(s)")
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    successful = 0
+    failed = 0
+    for email_address, result in zip(addresses, results):
+        if result is True:
+            successful += 1
+        else:
+            if isinstance(result, Exception):
+                logger.error(f"Error processing {email_address}: {result}")
             failed += 1
 
     return successful, failed
@@ -290,15 +311,18 @@ def main():
         logger.info(f"Found {email_count} email(s) in CSV file")
 
         # Send emails
-        successful, failed = send_emails(
-            csv_reader=csv_reader,
-            template_handler=template_handler,
-            email_sender=email_sender,
-            ollama_generator=ollama_generator,
-            subject=subject,
-            limit=args.limit,
-            use_llm=not args.no_llm,
+        successful, failed = asyncio.run(
+            send_emails(
+                csv_reader=csv_reader,
+                template_handler=template_handler,
+                email_sender=email_sender,
+                ollama_generator=ollama_generator,
+                subject=subject,
+                limit=args.limit,
+                use_llm=not args.no_llm,
+            )
         )
+        email_sender.close()
 
         # Summary
         logger.info("=" * 60)
@@ -3,14 +3,23 @@
 from .csv_reader import CSVReader
 from .template_handler import TemplateHandler
 from .ollama_generator import OllamaGenerator
-from .email_sender import EmailSender, DryRunEmailSender
+from .email_sender import (
+    BatchSendExecutor,
+    DryRunEmailSender,
+    EmailSender,
+    SMTPConnectionPool,
+    build_mime,
+)
 from .config import Config
 
 __all__ = [
     "CSVReader",
     "TemplateHandler",
     "OllamaGenerator",
+    "BatchSendExecutor",
     "EmailSender",
     "DryRunEmailSender",
+    "SMTPConnectionPool",
     "Config",
+    "build_mime",
 ]
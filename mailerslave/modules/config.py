@@ -1,17 +1,55 @@
 """Configuration management module."""
 
+import importlib.util
+import keyword
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict
-from dotenv import load_dotenv
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _smtp_config() -> Dict[str, any]:
+    """Read the SMTP settings from the environment; cached until env reload."""
+    return {
+        "smtp_host": os.getenv("SMTP_HOST", "smtp.gmail.com"),
+        "smtp_port": int(os.getenv("SMTP_PORT", "587")),
+        "username": os.getenv("SMTP_USERNAME", ""),
+        "password": os.getenv("SMTP_PASSWORD", ""),
+        "use_tls": os.getenv("SMTP_USE_TLS", "true").lower() == "true",
+        "from_email": os.getenv("SMTP_FROM_EMAIL"),
+    }
+
+
+@lru_cache(maxsize=1)
+def _ollama_config() -> Dict[str, any]:
+    """Read the Ollama settings from the environment; cached until env reload."""
+    return {
+        "model": os.getenv("OLLAMA_MODEL", "llama2"),
+        "host": os.getenv("OLLAMA_HOST"),
+        "temperature": float(os.getenv("OLLAMA_TEMPERATURE", "0.7")),
+    }
+
+
+@lru_cache(maxsize=1)
+def _email_config() -> Dict[str, str]:
+    """Read the email settings from the environment; cached until env reload."""
+    return {
+        "subject": os.getenv("EMAIL_SUBJECT", ""),
+        "dry_run": os.getenv("DRY_RUN", "false").lower() == "true",
+    }
+
+
 class Config:
     """Manages configuration from environment variables and .env files."""
 
+    # Files already fed to load_dotenv, so repeated Config() construction
+    # does not re-parse the same .env
+    _loaded_files: set = set()
+
     def __init__(self, env_file: Optional[str] = None):
         """
         Initialize configuration.
@@ -21,14 +59,103 @@ class Config:
         """
         # Load .env file if specified
         if env_file and Path(env_file).exists():
-            load_dotenv(env_file)
-            logger.info(f"Loaded configuration from {env_file}")
+            self._load(Path(env_file))
         else:
             # Try to load from default .env in current directory
             default_env = Path(".env")
             if default_env.exists():
-                load_dotenv(default_env)
-                logger.info("Loaded configuration from .env")
+                self._load(default_env)
+
+    @classmethod
+    def _load(cls, env_path: Path):
+        """Parse an env file once and invalidate the cached getter results."""
+        key = str(env_path.resolve())
+        if key in cls._loaded_files:
+            return
+
+        # Prefer the compiled module if it is current: importing Python
+        # assignments skips dotenv's line parser entirely
+        compiled = cls._compiled_path(env_path)
+        if (
+            compiled.exists()
+            and compiled.stat().st_mtime >= env_path.stat().st_mtime
+            and cls._load_compiled(compiled)
+        ):
+            logger.info(f"Loaded configuration from {compiled}")
+        else:
+            # Deferred so the compiled-module fast path (and runs with no env
+            # file at all) never pays for importing dotenv
+            from dotenv import load_dotenv
+
+            load_dotenv(env_path)
+            logger.info(f"Loaded configuration from {env_path}")
+
+        cls._loaded_files.add(key)
+
+        # The environment changed; memoized snapshots are stale
+        _smtp_config.cache_clear()
+        _ollama_config.cache_clear()
+        _email_config.cache_clear()
+
+    @staticmethod
+    def _compiled_path(env_path: Path) -> Path:
+        """Path of the compiled companion module for an env file."""
+        return env_path.with_name(env_path.name + ".compiled.py")
+
+    @staticmethod
+    def _load_compiled(compiled: Path) -> bool:
+        """Import a compiled env module into os.environ; False on failure."""
+        try:
+            spec = importlib.util.spec_from_file_location("_mailerslave_env", compiled)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception as e:
+            logger.warning(f"Failed to load compiled env {compiled}: {e}")
+            return False
+
+        for name, value in vars(module).items():
+            if not name.startswith("_") and isinstance(value, str):
+                # Mirror load_dotenv's default of not overriding real env vars
+                os.environ.setdefault(name, value)
+        return True
+
+    @classmethod
+    def compile_env(cls, env_file: str = ".env", dst: Optional[str] = None) -> str:
+        """
+        Compile an env file into an importable Python module.
+
+        Later runs import the generated assignments instead of re-parsing
+        the env file, trimming startup for short-lived CLI invocations.
+
+        Args:
+            env_file: Path to the env file to compile
+            dst: Destination path (default: \"<env_file>.compiled.py\")
+
+        Returns:
+            Path of the generated module
+        """
+        from dotenv import dotenv_values
+
+        env_path = Path(env_file)
+        compiled = Path(dst) if dst else cls._compiled_path(env_path)
+
+        values = dotenv_values(env_path)
+        lines = ["# Generated by Config.compile_env; do not edit by hand.\n"]
+        for name, value in values.items():
+            if value is None:
+                continue
+            # dotenv accepts keys like FOO-BAR that are not valid Python
+            # assignments; one such line would break the whole module import
+            if not name.isidentifier() or keyword.iskeyword(name):
+                logger.warning(
+                    f"Skipping key {name!r} from {env_path}: not a valid identifier"
+                )
+                continue
+            lines.append(f"{name} = {value!r}\n")
+        compiled.write_text("".join(lines), encoding="utf-8")
+
+        logger.info(f"Compiled {env_path} to {compiled}")
+        return str(compiled)
 
     @staticmethod
     def get_smtp_config() -> Dict[str, any]:
@@ -38,14 +165,8 @@ class Config:
         Returns:
             Dictionary containing SMTP configuration
         """
-        return {
-            "smtp_host": os.getenv("SMTP_HOST", "smtp.gmail.com"),
-            "smtp_port": int(os.getenv("SMTP_PORT", "587")),
-            "username": os.getenv("SMTP_USERNAME", ""),
-            "password": os.getenv("SMTP_PASSWORD", ""),
-            "use_tls": os.getenv("SMTP_USE_TLS", "true").lower() == "true",
-            "from_email": os.getenv("SMTP_FROM_EMAIL"),
-        }
+        # Copy so callers can override entries without poisoning the cache
+        return dict(_smtp_config())
 
     @staticmethod
     def get_ollama_config() -> Dict[str, any]:
@@ -55,11 +176,7 @@ class Config:
         Returns:
             Dictionary containing Ollama configuration
         """
-        return {
-            "model": os.getenv("OLLAMA_MODEL", "llama2"),
-            "host": os.getenv("OLLAMA_HOST"),
-            "temperature": float(os.getenv("OLLAMA_TEMPERATURE", "0.7")),
-        }
+        return dict(_ollama_config())
 
     @staticmethod
     def get_email_config() -> Dict[str, str]:
@@ -69,7 +186,4 @@ class Config:
         Returns:
             Dictionary containing email configuration
         """
-        return {
-            "subject": os.getenv("EMAIL_SUBJECT", ""),
-            "dry_run": os.getenv("DRY_RUN", "false").lower() == "true",
-        }
+        return dict(_email_config())
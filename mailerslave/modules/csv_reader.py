@@ -2,33 +2,51 @@
 
 import csv
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterator, List
+
+# pyarrow's C++ CSV tokenizer parses large files many times faster than
+# csv.DictReader; fall back to the stdlib when it is not installed
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
 
 class CSVReader:
     """Reads email addresses and associated data from CSV files."""
 
-    def __init__(self, csv_path: str):
+    # Default read buffer; Python's 8 KiB default causes thousands of small
+    # reads on multi-MB contact lists, especially over network mounts
+    DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, csv_path: str, buffer_size: int = DEFAULT_BUFFER_SIZE):
         """
         Initialize the CSV reader.
 
         Args:
             csv_path: Path to the CSV file
+            buffer_size: Read buffer size in bytes (default: 1 MiB)
         """
         self.csv_path = Path(csv_path)
+        self.buffer_size = buffer_size
         if not self.csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    def read_emails(self) -> List[Dict[str, str]]:
+    def iter_emails(self) -> Iterator[Dict[str, str]]:
         """
-        Read email addresses and associated data from the CSV file.
+        Yield email rows from the CSV file as they are parsed.
 
-        Returns:
-            List of dictionaries containing email data
-        """
-        emails_data = []
+        Keeps memory constant for large files and lets callers start
+        processing before the whole file has been read.
 
-        with open(self.csv_path, "r", encoding="utf-8") as csvfile:
+        Yields:
+            Dictionaries containing email data
+        """
+        with open(
+            self.csv_path, "r", encoding="utf-8", buffering=self.buffer_size
+        ) as csvfile:
             reader = csv.DictReader(csvfile)
 
             # Validate that the CSV has an 'email' column
@@ -37,15 +55,82 @@ class CSVReader:
 
             for row in reader:
                 if row.get("email"):  # Skip empty email rows
-                    emails_data.append(row)
+                    yield row
+
+    def _read_table(self):
+        """Parse the whole file into an Arrow table of string columns."""
+        table = pa_csv.read_csv(self.csv_path)
+
+        if "email" not in table.column_names:
+            raise ValueError("CSV file must contain an 'email' column")
+
+        # Keep dict-of-str semantics regardless of inferred column types
+        table = table.cast(
+            pa.schema([(name, pa.string()) for name in table.column_names])
+        )
+
+        # Skip empty email rows, like the DictReader path does
+        email_column = table["email"]
+        mask = pc.and_(
+            email_column.is_valid(), pc.not_equal(email_column, "")
+        )
+        return table.filter(mask)
+
+    def read_emails(self) -> List[Dict[str, str]]:
+        """
+        Read email addresses and associated data from the CSV file.
+
+        Uses pyarrow's parallel C++ parser when available; otherwise falls
+        back to streaming rows through csv.DictReader.
+
+        Returns:
+            List of dictionaries containing email data
+        """
+        if pa is not None:
+            return self._read_table().to_pylist()
+        return list(self.iter_emails())
 
-        return emails_data
+    def get_column(self, column: str) -> List[str]:
+        """
+        Read a single column of the CSV file.
+
+        Args:
+            column: Column name to extract
+
+        Returns:
+            The column values as a list of strings
+        """
+        if pa is not None:
+            table = self._read_table()
+            if column not in table.column_names:
+                raise ValueError(f"CSV file has no '{column}' column")
+            return table[column].to_pylist()
+        return [row.get(column, "") for row in self.iter_emails()]
 
     def get_email_count(self) -> int:
         """
-        Get the total number of emails in the CSV file.
+        Get the total number of data rows in the CSV file.
+
+        Reads the file in large chunks and counts newlines with
+        bytes.count — one vectorized memchr scan per chunk instead of
+        parsing every row.
 
         Returns:
             Number of email addresses
         """
-        return len(self.read_emails())
+        if self.csv_path.stat().st_size == 0:
+            return 0
+
+        newlines = 0
+        last_byte = b""
+        with open(self.csv_path, "rb") as csvfile:
+            while True:
+                chunk = csvfile.read(self.buffer_size)
+                if not chunk:
+                    break
+                newlines += chunk.count(b"\n")
+                last_byte = chunk[-1:]
+
+        # A missing trailing newline still terminates the last row
+        lines = newlines if last_byte == b"\n" else newlines + 1
+        return max(lines - 1, 0)  # minus the header row
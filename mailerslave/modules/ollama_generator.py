@@ -1,11 +1,25 @@
 """Ollama LLM integration module for generating personalized email content."""
 
-import ollama
-from typing import Dict, Optional
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import logging
 
+if TYPE_CHECKING:
+    import ollama
+
 logger = logging.getLogger(__name__)
 
+# Keep the model resident between calls so a batch does not pay the
+# load/warmup cost per request
+_KEEP_ALIVE = "10m"
+
+DEFAULT_SYSTEM_PROMPT = (
+    "You are an expert email writer. Generate a personalized, professional email "
+    "based on the template and recipient data provided. Maintain the tone and "
+    "structure of the template while personalizing the content. "
+    "Return only the email content without any additional commentary."
+)
+
 
 class OllamaGenerator:
     """Generates personalized email content using Ollama LLM API."""
@@ -23,7 +37,29 @@ class OllamaGenerator:
         """
         self.model = model
         self.temperature = temperature
+        self.host = host
+        # Importing ollama drags in httpx and TLS setup, so it happens here
+        # rather than at module load — runs that never construct a generator
+        # (--dry-run, --no-llm, --help) skip the cost entirely
+        import ollama
+
+        self._ollama = ollama
         self.client = ollama.Client(host=host) if host else ollama.Client()
+        # Async client for batched generation; created on first use
+        self._async_client: Optional["ollama.AsyncClient"] = None
+        # One stable system message, byte-for-byte identical across calls,
+        # so Ollama's prefix cache can skip re-prefilling it
+        self._system_msg = {"role": "system", "content": DEFAULT_SYSTEM_PROMPT}
+
+    def _get_async_client(self) -> "ollama.AsyncClient":
+        """Get (or lazily create) the async Ollama client."""
+        if self._async_client is None:
+            self._async_client = (
+                self._ollama.AsyncClient(host=self.host)
+                if self.host
+                else self._ollama.AsyncClient()
+            )
+        return self._async_client
 
     def generate_email(
         self, template: str, recipient_data: Dict[str, str], system_prompt: Optional[str] = None
@@ -39,33 +75,14 @@ class OllamaGenerator:
         Returns:
             Generated email content
         """
-        if system_prompt is None:
-            system_prompt = (
-                "You are an expert email writer. Generate a personalized, professional email "
-                "based on the template and recipient data provided. Maintain the tone and "
-                "structure of the template while personalizing the content. "
-                "Return only the email content without any additional commentary."
-            )
-
-        # Create a prompt combining template and recipient data
-        user_prompt = f"""Template:
-{template}
-
-Recipient Data:
-{self._format_recipient_data(recipient_data)}
-
-Please generate a personalized email based on the template above, incorporating the recipient data naturally."""
-
         try:
             logger.info(f"Generating email for recipient: {recipient_data.get('email', 'unknown')}")
 
             response = self.client.chat(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
+                messages=self._build_messages(template, recipient_data, system_prompt),
                 options={"temperature": self.temperature},
+                keep_alive=_KEEP_ALIVE,
             )
 
             generated_content = response["message"]["content"]
@@ -77,6 +94,84 @@ Please generate a personalized email based on the template above, incorporating
             logger.error(f"Error generating email with Ollama: {e}")
             raise RuntimeError(f"Failed to generate email: {e}")
 
+    async def generate_many(
+        self,
+        items: List[Tuple[str, Dict[str, str]]],
+        system_prompt: Optional[str] = None,
+        concurrency: int = 4,
+    ) -> List[str]:
+        """
+        Generate personalized emails for many recipients concurrently.
+
+        Runs up to `concurrency` chat requests at once over the async
+        client, overlapping HTTP latency with inference; keep_alive holds
+        the model resident across the whole batch.
+
+        Args:
+            items: List of (template, recipient_data) pairs
+            system_prompt: Optional system prompt shared by all items
+            concurrency: Max in-flight requests; size this to the Ollama
+                server's parallelism (default: 4)
+
+        Returns:
+            Generated email contents, in item order
+        """
+        client = self._get_async_client()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _generate_one(template: str, recipient_data: Dict[str, str]) -> str:
+            async with semaphore:
+                try:
+                    response = await client.chat(
+                        model=self.model,
+                        messages=self._build_messages(
+                            template, recipient_data, system_prompt
+                        ),
+                        options={"temperature": self.temperature},
+                        keep_alive=_KEEP_ALIVE,
+                    )
+                    return response["message"]["content"]
+                except Exception as e:
+                    logger.error(f"Error generating email with Ollama: {e}")
+                    raise RuntimeError(f"Failed to generate email: {e}")
+
+        return await asyncio.gather(
+            *(_generate_one(template, data) for template, data in items)
+        )
+
+    def _build_messages(
+        self,
+        template: str,
+        recipient_data: Dict[str, str],
+        system_prompt: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for one recipient.
+
+        Args:
+            template: Base email template
+            recipient_data: Dictionary containing recipient-specific data
+            system_prompt: Optional system prompt to guide the LLM
+
+        Returns:
+            Messages list for client.chat
+        """
+        # Create a prompt combining template and recipient data
+        user_prompt = f"""Template:
+{template}
+
+Recipient Data:
+{self._format_recipient_data(recipient_data)}
+
+Please generate a personalized email based on the template above, incorporating the recipient data naturally."""
+
+        system_msg = (
+            self._system_msg
+            if system_prompt is None
+            else {"role": "system", "content": system_prompt}
+        )
+        return [system_msg, {"role": "user", "content": user_prompt}]
+
     def _format_recipient_data(self, data: Dict[str, str]) -> str:
         """
         Format recipient data for the prompt.
@@ -89,6 +184,19 @@ Please generate a personalized email based on the template above, incorporating
         """
         return "\n".join([f"- {key}: {value}" for key, value in data.items()])
 
+    def warm_up(self):
+        """
+        Load the model ahead of the first generation.
+
+        An empty generate call pulls the model into memory with a long
+        keep_alive, so the first real email does not pay the load time.
+        """
+        try:
+            self.client.generate(model=self.model, prompt="", keep_alive="30m")
+            logger.info(f"Model '{self.model}' warmed up")
+        except Exception as e:
+            logger.warning(f"Model warm-up failed: {e}")
+
     def test_connection(self) -> bool:
         """
         Test the connection to Ollama API.
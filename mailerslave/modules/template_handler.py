@@ -1,8 +1,13 @@
 """Template handler module for managing email templates."""
 
+import io
+import re
 from pathlib import Path
-from string import Template
-from typing import Dict
+from typing import Dict, Final
+
+# Matches the $$ escape and $name / ${name} placeholders; compiled once
+# at import. $$ must come first so a literal dollar never starts a match.
+_PLACEHOLDER_RE: Final = re.compile(r"\$\$|\$\{?([a-zA-Z_][a-zA-Z0-9_]*)\}?")
 
 
 class TemplateHandler:
@@ -19,9 +24,37 @@ class TemplateHandler:
         if not self.template_path.exists():
             raise FileNotFoundError(f"Template file not found: {template_path}")
 
-        with open(self.template_path, "r", encoding="utf-8") as f:
+        # Large buffer so multi-MB templates load with few syscalls
+        with open(
+            self.template_path, "r", encoding="utf-8", buffering=1024 * 1024
+        ) as f:
             self.template_content = f.read()
 
+        # Split the template into literal and placeholder segments once, so
+        # each render is a join over precomputed pieces instead of a regex
+        # walk through the whole body
+        self._segments = []
+        pos = 0
+        for match in _PLACEHOLDER_RE.finditer(self.template_content):
+            if match.start() > pos:
+                self._segments.append(("lit", self.template_content[pos:match.start()]))
+            if match.group(1) is None:
+                # The $$ escape collapses to one literal dollar, matching
+                # safe_substitute's behavior
+                self._segments.append(("lit", "$"))
+            else:
+                # Keep the matched text so missing variables stay literal,
+                # matching safe_substitute's behavior
+                self._segments.append(("var", match.group(1), match.group(0)))
+            pos = match.end()
+        if pos < len(self.template_content):
+            self._segments.append(("lit", self.template_content[pos:]))
+
+        # Placeholder names fall out of the segment parse; memoize them
+        self._placeholders = frozenset(
+            segment[1] for segment in self._segments if segment[0] == "var"
+        )
+
     def get_template(self) -> str:
         """
         Get the raw template content.
@@ -41,23 +74,24 @@ class TemplateHandler:
         Returns:
             Rendered template string
         """
-        template = Template(self.template_content)
         try:
-            return template.safe_substitute(variables)
+            # Stream segments into a single growable buffer; one final
+            # allocation in getvalue() instead of intermediate concatenations
+            buf = io.StringIO()
+            for segment in self._segments:
+                if segment[0] == "lit":
+                    buf.write(segment[1])
+                else:
+                    buf.write(str(variables.get(segment[1], segment[2])))
+            return buf.getvalue()
         except Exception as e:
             raise ValueError(f"Error rendering template: {e}")
 
-    def extract_placeholders(self) -> set:
+    def extract_placeholders(self) -> frozenset:
         """
         Extract placeholder variables from the template.
 
         Returns:
             Set of placeholder variable names
         """
-        template = Template(self.template_content)
-        # This is a simple extraction - Template doesn't provide this directly
-        import re
-
-        pattern = r"\$\{?([a-zA-Z_][a-zA-Z0-9_]*)\}?"
-        placeholders = set(re.findall(pattern, self.template_content))
-        return placeholders
+        return self._placeholders
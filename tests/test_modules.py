@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 import tempfile
+import threading
 import csv
 
 
@@ -64,6 +65,26 @@ def test_template_handler():
         Path(temp_template).unlink()
 
 
+def test_template_handler_dollar_escape():
+    """Test that $$ renders as a literal dollar, like safe_substitute."""
+    from mailerslave.modules import TemplateHandler
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+        f.write("Win $$100 today, $name!")
+        temp_template = f.name
+
+    try:
+        handler = TemplateHandler(temp_template)
+
+        rendered = handler.render_template({"name": "John"})
+        assert rendered == "Win $100 today, John!"
+
+        # The escape contributes no placeholder
+        assert handler.extract_placeholders() == {"name"}
+    finally:
+        Path(temp_template).unlink()
+
+
 def test_template_handler_missing_file():
     """Test template handler with missing file."""
     from mailerslave.modules import TemplateHandler
@@ -72,6 +93,204 @@ def test_template_handler_missing_file():
         TemplateHandler("nonexistent.txt")
 
 
+def test_csv_reader_email_count_blank_lines():
+    """Test that get_email_count counts physical rows, blank lines included."""
+    from mailerslave.modules import CSVReader
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+        f.write("email,name\n")
+        f.write("a@example.com,A\n")
+        f.write("\n")
+        f.write("b@example.com,B\n")
+        temp_csv = f.name
+
+    try:
+        reader = CSVReader(temp_csv)
+
+        # Raw line count minus the header; blank lines count as rows
+        assert reader.get_email_count() == 3
+
+        # The parser itself still skips the blank row
+        assert len(list(reader.iter_emails())) == 2
+    finally:
+        Path(temp_csv).unlink()
+
+
+def test_smtp_connection_pool():
+    """Test pool reuse, rotation at the message cap, and waiter wake-up."""
+    from mailerslave.modules import SMTPConnectionPool
+
+    class FakeServer:
+        def noop(self):
+            return (250, b"ok")
+
+        def quit(self):
+            pass
+
+    created = []
+
+    def connect():
+        server = FakeServer()
+        created.append(server)
+        return server
+
+    pool = SMTPConnectionPool(connect, pool_size=1, max_messages_per_connection=2)
+
+    # A released session is reused while under the message cap
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+
+    # The second release hits the cap; the next acquire gets a fresh session
+    pool.release(first)
+    second = pool.acquire()
+    assert second is not first
+    assert len(created) == 2
+
+    # A thread blocked at capacity must wake when the session is discarded
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    waiter.start()
+    waiter.join(timeout=0.2)
+    assert not acquired
+
+    pool.discard(second)
+    waiter.join(timeout=2)
+    assert acquired and acquired[0] is created[-1]
+
+    pool.release(acquired[0])
+    pool.close()
+
+
+def test_batch_send_executor():
+    """Test that concurrent sends are flushed over one pooled session."""
+    from concurrent.futures import ThreadPoolExecutor
+    from mailerslave.modules import BatchSendExecutor, EmailSender
+
+    class FakeServer:
+        def __init__(self):
+            self.sent = []
+
+        def noop(self):
+            return (250, b"ok")
+
+        def quit(self):
+            pass
+
+        def send_message(self, msg):
+            self.sent.append(msg["To"])
+
+    sender = EmailSender("localhost", 25, "user", "secret")
+    server = FakeServer()
+    sender._pool._connect = lambda: server
+
+    executor = BatchSendExecutor(sender, max_batch=4, max_wait=0.05)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as producers:
+            results = list(
+                producers.map(
+                    lambda i: executor.send_email(
+                        f"user{i}@example.com", "Hello", "Body"
+                    ),
+                    range(4),
+                )
+            )
+
+        assert results == [True] * 4
+        assert sorted(server.sent) == [f"user{i}@example.com" for i in range(4)]
+    finally:
+        executor.close()
+
+
+def test_build_mime():
+    """Test that prebuilt messages are CRLF-clean and survive any subject."""
+    from mailerslave.modules import build_mime
+
+    raw = build_mime("from@example.com", "to@example.com", "Héllo", "line1\nline2")
+
+    # Wire bytes must use CRLF line endings throughout (RFC 5321)
+    for line in raw.split(b"\r\n"):
+        assert b"\n" not in line
+
+    # Non-ASCII subjects go out RFC 2047-encoded instead of crashing
+    assert b"Subject: =?utf-8?" in raw
+    assert b"To: to@example.com" in raw
+
+
+def test_send_many_prebuilt():
+    """Test process-pool prebuilt sends end to end against a fake session."""
+    from mailerslave.modules import EmailSender
+
+    class FakeServer:
+        def __init__(self):
+            self.sent = []
+
+        def noop(self):
+            return (250, b"ok")
+
+        def quit(self):
+            pass
+
+        def sendmail(self, from_addr, to_addrs, raw):
+            self.sent.append((to_addrs[0], raw))
+
+    sender = EmailSender("localhost", 25, "user", "secret")
+    server = FakeServer()
+    sender._pool._connect = lambda: server
+
+    messages = [
+        ("user0@example.com", "Hello", "Body"),
+        ("user1@example.com", "Héllo", "Body"),
+    ]
+    results = sender.send_many_prebuilt(messages, max_workers=2)
+
+    assert results == [True, True]
+    assert sorted(to for to, _ in server.sent) == [
+        "user0@example.com",
+        "user1@example.com",
+    ]
+
+
+def test_batch_send_executor_abort_threshold():
+    """Test that a large mostly-failing batch aborts instead of draining."""
+    from mailerslave.modules.email_sender import _PendingSend
+    from mailerslave.modules import BatchSendExecutor, EmailSender
+
+    class FailingServer:
+        def __init__(self):
+            self.attempts = 0
+
+        def noop(self):
+            return (250, b"ok")
+
+        def quit(self):
+            pass
+
+        def send_message(self, msg):
+            self.attempts += 1
+            raise RuntimeError("rejected")
+
+    sender = EmailSender("localhost", 25, "user", "secret")
+    server = FailingServer()
+    sender._pool._connect = lambda: server
+
+    # Drive _flush directly so the batch size is deterministic
+    executor = BatchSendExecutor.__new__(BatchSendExecutor)
+    executor._sender = sender
+
+    batch = [
+        _PendingSend(f"user{i}@example.com", "Hello", "Body", False)
+        for i in range(30)
+    ]
+    executor._flush(batch)
+
+    assert all(pending.result is False for pending in batch)
+    assert all(pending.event.is_set() for pending in batch)
+
+    # Aborted after a third of the batch failed instead of trying all 30
+    assert server.attempts == 10
+
+
 def test_dry_run_email_sender():
     """Test dry-run email sender."""
     from mailerslave.modules import DryRunEmailSender